@@ -8,8 +8,28 @@ from importlib import metadata
 
 __author__ = """InOrbit Inc."""
 __email__ = "support@inorbit.ai"
-# Read the installed package version from metadata
-try:
-    __version__ = metadata.version("flowcore-connector")
-except metadata.PackageNotFoundError:
-    __version__ = "unknown"
+
+
+def __getattr__(name: str) -> str:
+    """Read the installed package version from metadata on first access.
+
+    Looking up the package metadata scans the installed distributions, so it is deferred until
+    __version__ is actually used and then stored as a regular module attribute.
+
+    Args:
+        name: Name of the missing module attribute
+
+    Returns:
+        str: The package version, or "unknown" if the package is not installed
+
+    Raises:
+        AttributeError: If the attribute is not __version__
+    """
+    if name == "__version__":
+        try:
+            version = metadata.version("flowcore-connector")
+        except metadata.PackageNotFoundError:
+            version = "unknown"
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
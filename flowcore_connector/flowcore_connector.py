@@ -5,36 +5,253 @@
 """Entry point for the InOrbit FLOWCore Connector."""
 
 # Standard
-import argparse
 import logging
 import signal
 import sys
-from typing import NoReturn
+from typing import TYPE_CHECKING, NamedTuple, NoReturn
 
-# InOrbit
-from inorbit_connector.utils import read_yaml
+# Third Party
+import yaml
 
-# Local
-from flowcore_connector import __version__
-from flowcore_connector.src.config.models import FlowcoreConnectorConfig
-from flowcore_connector.src.connector import FlowcoreConnector
+# The configuration models and the connector pull in Pydantic and the InOrbit SDKs, which take
+# a noticeable time to import. They are imported after parsing the command line arguments so
+# --help and --version return immediately.
+if TYPE_CHECKING:
+    from flowcore_connector.src.config.models import FlowcoreConnectorConfig
 
-logging.basicConfig(level=logging.INFO)
 LOGGER = logging.getLogger(__name__)
 
+# Prefer the LibYAML based loader, which is considerably faster than the pure Python one
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
-class CustomParser(argparse.ArgumentParser):
-    """Custom argument parser that shows help on error."""
 
-    def error(self, message: str) -> NoReturn:
-        """Handle parser errors by showing help.
+PROG = "flowcore-connector"
 
-        Args:
-            message: Error message to display
-        """
-        sys.stderr.write(f"error: {message}\n")
-        self.print_help()
-        sys.exit(2)
+USAGE = f"usage: {PROG} [-h] -c CONFIG [--trust-config] [--cache-config] [--version]\n"
+
+HELP = f"""{USAGE}
+InOrbit FLOWCore Connector
+
+options:
+  -h, --help            show this help message and exit
+  -c, --config CONFIG   Path to YAML configuration file
+  --trust-config        Skip validation of the fleet configuration. Use only with
+                        known-good files
+  --cache-config        Cache the loaded configuration to speed up later runs with
+                        the same file
+  --version             show program's version number and exit
+"""
+
+
+class CommandLineArgs(NamedTuple):
+    """Parsed command-line arguments.
+
+    Attributes:
+        config: Path to the YAML configuration file
+        trust_config: Skip validation of the fleet configuration
+        cache_config: Cache the loaded configuration
+    """
+
+    config: str
+    trust_config: bool = False
+    cache_config: bool = False
+
+
+def _parse_error(message: str) -> NoReturn:
+    """Handle command-line errors by showing help.
+
+    Args:
+        message: Error message to display
+    """
+    sys.stderr.write(f"error: {message}\n")
+    sys.stdout.write(HELP)
+    sys.exit(2)
+
+
+def _parse_args(argv: list[str]) -> CommandLineArgs:
+    """Parse the command-line arguments.
+
+    The connector takes only a handful of flags, so they are parsed by hand instead of with
+    argparse to keep startup fast.
+
+    Args:
+        argv: Command-line arguments, excluding the program name
+
+    Returns:
+        CommandLineArgs: The parsed arguments
+    """
+    config = None
+    flags = {"--trust-config": False, "--cache-config": False}
+    args = iter(argv)
+    for arg in args:
+        if arg in ("-h", "--help"):
+            sys.stdout.write(HELP)
+            sys.exit(0)
+        elif arg == "--version":
+            # Local
+            from flowcore_connector import __version__
+
+            sys.stdout.write(f"{PROG} {__version__}\n")
+            sys.exit(0)
+        elif arg in flags:
+            flags[arg] = True
+        elif arg in ("-c", "--config"):
+            config = next(args, None)
+            if config is None or config.startswith("-"):
+                _parse_error("argument -c/--config: expected one argument")
+        elif arg.startswith("--config="):
+            config = arg.removeprefix("--config=")
+        elif arg.startswith("-c") and len(arg) > 2:
+            config = arg[2:]
+        else:
+            _parse_error(f"unrecognized arguments: {arg}")
+
+    if config is None:
+        _parse_error("the following arguments are required: -c/--config")
+    return CommandLineArgs(config, flags["--trust-config"], flags["--cache-config"])
+
+
+def _fast_read_yaml(path: str) -> dict:
+    """Read a YAML configuration file.
+
+    Equivalent to `inorbit_connector.utils.read_yaml()` but parses the file with the LibYAML
+    C loader when available.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        dict: The data read from the YAML file, or an empty dictionary if the file is empty
+
+    Raises:
+        FileNotFoundError: If the configuration file does not exist
+        yaml.YAMLError: If the configuration file is not valid YAML
+    """
+    with open(path, "rb") as file:
+        return yaml.load(file, Loader=YamlLoader) or {}
+
+
+def _check_trusted_robot(index: int, robot: object) -> None:
+    """Check the fields of a robot configuration the fleet-wide checks rely on.
+
+    The robot configurations built by _build_trusted() are not validated, but the fleet-wide
+    checks compare robot_id and fleet_robot_id values, so these must be present and have the
+    right type for the checks to be meaningful.
+
+    Args:
+        index: Position of the robot in the fleet list
+        robot: Robot configuration data read from the YAML file
+
+    Raises:
+        ValueError: If the robot configuration or any of the checked fields is malformed
+    """
+    if not isinstance(robot, dict):
+        raise ValueError(f"fleet[{index}] must be a mapping")
+    if not isinstance(robot.get("robot_id"), str):
+        raise ValueError(f"fleet[{index}].robot_id must be a string")
+    fleet_robot_id = robot.get("fleet_robot_id")
+    if not isinstance(fleet_robot_id, int) or isinstance(fleet_robot_id, bool):
+        raise ValueError(f"fleet[{index}].fleet_robot_id must be an integer")
+    cameras = robot.get("cameras", [])
+    if not isinstance(cameras, list) or not all(isinstance(camera, dict) for camera in cameras):
+        raise ValueError(f"fleet[{index}].cameras must be a list of mappings")
+
+
+def _build_trusted(yaml_data: dict) -> "FlowcoreConnectorConfig":
+    """Build the connector configuration without validating each robot in the fleet.
+
+    Intended for known-good configuration files. The robot configurations, which grow with the
+    size of the fleet, are created with `model_construct()` and skip Pydantic validation, apart
+    from the type checks of _check_trusted_robot(). Pydantic does not revalidate model
+    instances, so the rest of the configuration and the fleet-wide checks (e.g. unique robot
+    IDs) are still validated as usual and missing connector_config fields are read from the
+    environment.
+
+    Args:
+        yaml_data: Configuration data read from the YAML file
+
+    Returns:
+        FlowcoreConnectorConfig: The constructed configuration
+
+    Raises:
+        ValueError: If the configuration is invalid or fleet_robot_id values are not unique
+    """
+    # InOrbit
+    from inorbit_connector.models import CameraConfig
+
+    # Local
+    from flowcore_connector.src.config.models import (
+        FlowcoreConnectorConfig,
+        FlowcoreRobotConfig,
+    )
+
+    if not isinstance(yaml_data, dict):
+        raise ValueError("configuration must be a mapping")
+    data = dict(yaml_data)
+    robots = data.pop("fleet", None) or []
+    if not isinstance(robots, list):
+        raise ValueError("fleet must be a list of robot configurations")
+    for index, robot in enumerate(robots):
+        _check_trusted_robot(index, robot)
+
+    fleet = [
+        FlowcoreRobotConfig.model_construct(
+            **{
+                **robot,
+                "cameras": [
+                    CameraConfig.model_construct(**camera) for camera in robot.get("cameras", [])
+                ],
+            }
+        )
+        for robot in robots
+    ]
+    return FlowcoreConnectorConfig(**data, fleet=fleet)
+
+
+def _load_config(
+    config_filename: str, trust_config: bool = False, use_cache: bool = False
+) -> "FlowcoreConnectorConfig":
+    """Load the connector configuration from a YAML file.
+
+    Args:
+        config_filename: Path to the YAML configuration file
+        trust_config: Skip validation of each robot configuration (see _build_trusted())
+        use_cache: Reuse the configuration built by a previous run if neither the file nor
+            the environment changed since
+
+    Returns:
+        FlowcoreConnectorConfig: The loaded configuration
+
+    Raises:
+        FileNotFoundError: If the configuration file does not exist
+        ValueError: If the configuration is invalid
+    """
+    # Local
+    from flowcore_connector.src.config.cache import (
+        config_cache_key,
+        load_cached_config,
+        store_cached_config,
+    )
+    from flowcore_connector.src.config.models import FlowcoreConnectorConfig
+
+    if use_cache:
+        cache_key = config_cache_key(config_filename, f"trust_config={trust_config}")
+        if config := load_cached_config(cache_key):
+            LOGGER.debug(f"Configuration loaded from cache ({cache_key})")
+            return config
+
+    yaml_data = _fast_read_yaml(config_filename)
+    if trust_config:
+        config = _build_trusted(yaml_data)
+    else:
+        config = FlowcoreConnectorConfig.model_validate(yaml_data)
+
+    if use_cache:
+        store_cached_config(cache_key, config)
+    return config
 
 
 def start() -> None:
@@ -43,33 +260,22 @@ def start() -> None:
     Parses command-line arguments, loads configuration, and starts the connector.
     Handles graceful shutdown on SIGINT.
     """
-    parser = CustomParser(
-        prog="flowcore-connector",
-        description="InOrbit FLOWCore Connector",
-    )
-    parser.add_argument(
-        "-c",
-        "--config",
-        type=str,
-        required=True,
-        help="Path to YAML configuration file",
-    )
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"%(prog)s {__version__}",
-    )
+    # Configure logging only when run as a command, and not if the host application already did
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO)
 
-    args = parser.parse_args()
+    args = _parse_args(sys.argv[1:])
     config_filename = args.config
 
+    # Local
+    from flowcore_connector.src.connector import FlowcoreConnector
+
     try:
-        yaml_data = read_yaml(config_filename)
-        config = FlowcoreConnectorConfig(**yaml_data)
+        config = _load_config(config_filename, args.trust_config, args.cache_config)
 
-        robot_ids = [robot.robot_id for robot in config.fleet]
-        LOGGER.info(f"Configuration loaded for fleet of {len(robot_ids)} robots")
-        LOGGER.info(f"Robot IDs: {robot_ids}")
+        LOGGER.info(f"Configuration loaded for fleet of {len(config.fleet)} robots")
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info(f"Robot IDs: {', '.join(robot.robot_id for robot in config.fleet)}")
 
     except FileNotFoundError:
         LOGGER.error(f"Configuration file '{config_filename}' not found")
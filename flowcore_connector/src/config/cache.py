@@ -0,0 +1,174 @@
+# SPDX-FileCopyrightText: 2026 InOrbit, Inc.
+#
+# SPDX-License-Identifier: MIT
+
+"""On-disk cache of parsed FLOWCore connector configurations."""
+
+# Standard
+import functools
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+from importlib import metadata
+from pathlib import Path
+
+# Local
+from flowcore_connector.src.config.models import DEFAULT_ENV_FILE, FlowcoreConnectorConfig
+
+LOGGER = logging.getLogger(__name__)
+
+# Environment variables with this prefix may be read while building the configuration
+ENV_PREFIX = "INORBIT_"
+
+# Installed distributions whose code defines or validates the cached configuration
+CODE_DISTRIBUTIONS = ("flowcore-connector", "inorbit-connector", "pydantic", "pydantic-core")
+
+
+def _default_cache_dir() -> Path:
+    """Get the default cache directory, following the XDG base directory specification.
+
+    Returns:
+        Path: $XDG_CACHE_HOME/flowcore-connector, or ~/.cache/flowcore-connector if
+            XDG_CACHE_HOME is unset or empty
+    """
+    return Path(os.environ.get("XDG_CACHE_HOME") or "~/.cache").expanduser() / "flowcore-connector"
+
+
+DEFAULT_CACHE_DIR = _default_cache_dir()
+
+
+@functools.cache
+def _code_fingerprint() -> str:
+    """Get a fingerprint of the code that builds and loads cached configurations.
+
+    Cached configurations are unpickled without validation, so an entry written by another
+    version of the models would be missing new fields or carry stale ones.
+
+    Returns:
+        str: Installed versions of CODE_DISTRIBUTIONS and the configuration JSON schema
+    """
+    versions = []
+    for name in CODE_DISTRIBUTIONS:
+        try:
+            versions.append(f"{name}=={metadata.version(name)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{name}==unknown")
+    schema = json.dumps(FlowcoreConnectorConfig.model_json_schema(), sort_keys=True)
+    return "\0".join([*versions, schema])
+
+
+def config_cache_key(path: str, *extra: str) -> str:
+    """Compute the cache key of a configuration file.
+
+    The key covers everything the configuration is built from: the file path, its modification
+    time and contents, the working directory relative paths are resolved against, the
+    environment file and INORBIT_* environment variables read by the configuration models, the
+    installed connector, inorbit-connector and pydantic versions, and the configuration schema.
+    Any change results in a new key.
+
+    Args:
+        path: Path to the YAML configuration file
+        *extra: Additional values to include in the key (e.g. loading options)
+
+    Returns:
+        str: Hexadecimal SHA-256 digest identifying the configuration
+
+    Raises:
+        FileNotFoundError: If the configuration file does not exist
+    """
+    path = os.path.abspath(path)
+    digest = hashlib.sha256()
+    for value in (_code_fingerprint(), path, str(os.stat(path).st_mtime_ns), os.getcwd(), *extra):
+        digest.update(value.encode())
+        digest.update(b"\0")
+    digest.update(Path(path).read_bytes())
+    digest.update(b"\0")
+    if os.path.isfile(DEFAULT_ENV_FILE):
+        digest.update(Path(DEFAULT_ENV_FILE).read_bytes())
+    for name in sorted(os.environ):
+        if name.startswith(ENV_PREFIX):
+            digest.update(f"\0{name}={os.environ[name]}".encode())
+    return digest.hexdigest()
+
+
+def _referenced_paths_exist(config: FlowcoreConnectorConfig) -> bool:
+    """Check that the files and directories referenced by a configuration still exist.
+
+    Validation checks these paths when the configuration is built, but they may have been
+    removed since it was cached.
+
+    Args:
+        config: The configuration to check
+
+    Returns:
+        bool: True if all the map files, the logging configuration file and the user scripts
+            directory exist
+    """
+    files = [map_config.file for map_config in config.maps.values()]
+    if config.logging.config_file is not None:
+        files.append(config.logging.config_file)
+    if not all(os.path.isfile(file) for file in files):
+        return False
+    return config.user_scripts_dir is None or os.path.isdir(config.user_scripts_dir)
+
+
+def load_cached_config(key: str, cache_dir: Path | None = None) -> FlowcoreConnectorConfig | None:
+    """Load a configuration from the cache.
+
+    Args:
+        key: Cache key, as returned by config_cache_key()
+        cache_dir: Cache directory, DEFAULT_CACHE_DIR by default
+
+    Returns:
+        FlowcoreConnectorConfig | None: The cached configuration, or None if it is not cached,
+            the cache entry is unreadable or a path it references no longer exists
+    """
+    cache_file = (cache_dir or DEFAULT_CACHE_DIR) / f"{key}.pkl"
+    try:
+        with open(cache_file, "rb") as file:
+            config = pickle.load(file)
+    except FileNotFoundError:
+        return None
+    except Exception as ex:
+        LOGGER.warning(f"Ignoring unreadable configuration cache '{cache_file}': {ex}")
+        return None
+
+    if not isinstance(config, FlowcoreConnectorConfig):
+        LOGGER.warning(f"Ignoring unexpected configuration cache '{cache_file}'")
+        return None
+    if not _referenced_paths_exist(config):
+        LOGGER.debug(f"Ignoring configuration cache '{cache_file}' with missing paths")
+        return None
+    return config
+
+
+def store_cached_config(
+    key: str, config: FlowcoreConnectorConfig, cache_dir: Path | None = None
+) -> None:
+    """Store a configuration in the cache.
+
+    The configuration may contain credentials, so the cache is only readable by the current
+    user. Failing to write the cache is logged and otherwise ignored.
+
+    Args:
+        key: Cache key, as returned by config_cache_key()
+        config: The configuration to store
+        cache_dir: Cache directory, DEFAULT_CACHE_DIR by default
+    """
+    cache_dir = cache_dir or DEFAULT_CACHE_DIR
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent readers never see a partial entry
+        fd, temp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(config, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_name, cache_dir / f"{key}.pkl")
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+    except Exception as ex:
+        LOGGER.warning(f"Failed to write configuration cache in '{cache_dir}': {ex}")
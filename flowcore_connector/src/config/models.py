@@ -4,12 +4,26 @@
 
 """Configuration models for FLOWCore connector."""
 
+# Standard
+import functools
+from collections.abc import Mapping
+from contextvars import ContextVar
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Literal
+
 # Third Party
 from pydantic import (
-    field_validator,
+    ConfigDict,
     model_validator,
 )
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import (
+    BaseSettings,
+    DotEnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+from pydantic_settings.sources import ENV_FILE_SENTINEL, DotenvType
 
 
 # InOrbit
@@ -21,6 +35,88 @@ CONNECTOR_TYPE = "flowcore"
 # different .env file, make sure to source it before running the connector.
 DEFAULT_ENV_FILE = "config/.env"
 
+# Env file and encoding requested for the FlowcoreConfig being initialized. See
+# FlowcoreConfig.__init__() and FlowcoreConfig.settings_customise_sources().
+_requested_env_file: ContextVar[tuple[DotenvType | None, str | None]] = ContextVar(
+    "_requested_env_file"
+)
+
+
+def ensure_unique_fleet_robot_ids(fleet: list["FlowcoreRobotConfig"]) -> None:
+    """Check that fleet_robot_id values are unique across the fleet.
+
+    Args:
+        fleet (list[FlowcoreRobotConfig]): List of robot configurations
+
+    Raises:
+        ValueError: If fleet_robot_id values are not unique
+    """
+    seen = set()
+    for robot in fleet:
+        fleet_robot_id = robot.fleet_robot_id
+        if fleet_robot_id in seen:
+            raise ValueError(
+                f"fleet_robot_id values must be unique, {fleet_robot_id} is duplicated"
+            )
+        seen.add(fleet_robot_id)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_env_file(
+    file_path: Path,
+    mtime_ns: int,
+    encoding: str | None,
+    case_sensitive: bool,
+    ignore_empty: bool,
+    parse_none_str: str | None,
+) -> Mapping[str, str | None]:
+    """Parse an env file, caching the result until the file is modified.
+
+    Args:
+        file_path (Path): Path to the env file
+        mtime_ns (int): Modification time of the file, part of the cache key
+        encoding (str | None): File encoding
+        case_sensitive (bool): Whether variable names are case sensitive
+        ignore_empty (bool): Whether to ignore variables with empty values
+        parse_none_str (str | None): String value to parse as None
+
+    Returns:
+        Mapping[str, str | None]: Read-only mapping of the variables in the file
+    """
+    return MappingProxyType(
+        DotEnvSettingsSource._static_read_env_file(
+            file_path,
+            encoding=encoding,
+            case_sensitive=case_sensitive,
+            ignore_empty=ignore_empty,
+            parse_none_str=parse_none_str,
+        )
+    )
+
+
+class CachedDotEnvSettingsSource(DotEnvSettingsSource):
+    """Settings source for env files that parses each file only once until it is modified."""
+
+    def _read_env_file(self, file_path: Path) -> Mapping[str, str | None]:
+        """Read an env file through the module-level cache.
+
+        Args:
+            file_path (Path): Path to the env file
+
+        Returns:
+            Mapping[str, str | None]: The variables in the file
+        """
+        if not file_path.is_file():
+            return super()._read_env_file(file_path)
+        return _read_env_file(
+            file_path.resolve(),
+            file_path.stat().st_mtime_ns,
+            self.env_file_encoding,
+            self.case_sensitive,
+            self.env_ignore_empty,
+            self.env_parse_none_str,
+        )
+
 
 class FlowcoreRobotConfig(RobotConfig):
     """Robot configuration with FLOWCore-specific fields.
@@ -33,6 +129,9 @@ class FlowcoreRobotConfig(RobotConfig):
         cameras (list): Camera configurations (inherited)
     """
 
+    # Robot configurations are never modified once loaded
+    model_config = ConfigDict(frozen=True)
+
     fleet_robot_id: int
 
 
@@ -57,7 +156,9 @@ class FlowcoreConfig(BaseSettings):
         env_ignore_empty=True,
         case_sensitive=False,
         env_file=DEFAULT_ENV_FILE,
-        extra="allow",
+        # Unknown fields are dropped. New settings must be declared as fields below
+        extra="ignore",
+        frozen=True,
     )
 
     fleet_host: str
@@ -65,6 +166,70 @@ class FlowcoreConfig(BaseSettings):
     fleet_username: str
     fleet_password: str
 
+    def __init__(
+        self,
+        _env_file: DotenvType | None = ENV_FILE_SENTINEL,
+        _env_file_encoding: str | None = None,
+        **values: Any,
+    ) -> None:
+        """Initialize the settings, reading the env file through CachedDotEnvSettingsSource.
+
+        The default env file source parses the file as soon as it is created, so it is given no
+        env file. The requested one is read by the cached source instead.
+
+        Args:
+            _env_file: Env file to read instead of the one in model_config
+            _env_file_encoding: Encoding of the env file
+            **values: Field values, and other BaseSettings initialization arguments
+        """
+        if _env_file == ENV_FILE_SENTINEL:
+            _env_file = self.model_config.get("env_file")
+        token = _requested_env_file.set((_env_file, _env_file_encoding))
+        try:
+            super().__init__(_env_file=None, **values)
+        finally:
+            _requested_env_file.reset(token)
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Read the env file through a cache instead of parsing it on every instantiation.
+
+        The cached source reads the env file requested in __init__(), and takes every other
+        setting from the default env file source, so per-instance overrides (e.g. `_env_file`
+        or `_env_prefix`) still apply.
+
+        Returns:
+            tuple[PydanticBaseSettingsSource, ...]: The default sources, in the default order,
+                with the env file source replaced by CachedDotEnvSettingsSource
+        """
+        env_file, env_file_encoding = _requested_env_file.get(
+            (dotenv_settings.env_file, dotenv_settings.env_file_encoding)
+        )
+        return (
+            init_settings,
+            env_settings,
+            CachedDotEnvSettingsSource(
+                settings_cls,
+                env_file=env_file,
+                env_file_encoding=env_file_encoding,
+                case_sensitive=dotenv_settings.case_sensitive,
+                env_prefix=dotenv_settings.env_prefix,
+                env_nested_delimiter=dotenv_settings.env_nested_delimiter,
+                env_nested_max_split=dotenv_settings.env_nested_max_split,
+                env_ignore_empty=dotenv_settings.env_ignore_empty,
+                env_parse_none_str=dotenv_settings.env_parse_none_str,
+                env_parse_enums=dotenv_settings.env_parse_enums,
+            ),
+            file_secret_settings,
+        )
+
 
 class FlowcoreConnectorConfig(ConnectorConfig):
     """Configuration for FLOWCore connector.
@@ -72,32 +237,15 @@ class FlowcoreConnectorConfig(ConnectorConfig):
     Inherits from ConnectorConfig and adds FLOWCore-specific fields.
 
     Attributes:
+        connector_type (Literal["flowcore"]): Connector type. Must be CONNECTOR_TYPE
         connector_config (FlowcoreConfig): FLOWCore-specific configuration
         fleet (list[FlowcoreRobotConfig]): List of robot configurations
     """
 
+    connector_type: Literal["flowcore"]  # type: ignore[assignment]
     connector_config: FlowcoreConfig  # type: ignore[assignment]
     fleet: list[FlowcoreRobotConfig]  # type: ignore[assignment]
 
-    @field_validator("connector_type")
-    def check_connector_type(cls, connector_type: str) -> str:
-        """Validate the connector type.
-
-        Args:
-            connector_type (str): The connector type from config
-
-        Returns:
-            str: The validated connector type
-
-        Raises:
-            ValueError: If connector type doesn't match expected value
-        """
-        if connector_type != CONNECTOR_TYPE:
-            raise ValueError(
-                f"Expected connector type '{CONNECTOR_TYPE}' not '{connector_type}'"
-            )
-        return connector_type
-
     @model_validator(mode="after")
     def validate_unique_fleet_robot_ids(self) -> "FlowcoreConnectorConfig":
         """Validate that fleet_robot_id values are unique across the fleet.
@@ -108,7 +256,5 @@ class FlowcoreConnectorConfig(ConnectorConfig):
         Raises:
             ValueError: If fleet_robot_id values are not unique
         """
-        fleet_ids = [robot.fleet_robot_id for robot in self.fleet]
-        if len(fleet_ids) != len(set(fleet_ids)):
-            raise ValueError("fleet_robot_id values must be unique")
+        ensure_unique_fleet_robot_ids(self.fleet)
         return self
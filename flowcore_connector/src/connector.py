@@ -5,6 +5,10 @@
 """FLOWCore multi-robot connector for InOrbit."""
 
 # Standard
+import functools
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import override
 
 # InOrbit
@@ -12,11 +16,34 @@ from inorbit_connector.connector import (
     CommandResultCode,
     FleetConnector,
 )
-from inorbit_connector.models import MapConfigTemp
+from inorbit_connector.models import MapConfigTemp, RobotConfig
 
 # Local
-from flowcore_connector import __version__ as connector_version
-from flowcore_connector.src.config.models import FlowcoreConnectorConfig
+from flowcore_connector.src.config.models import (
+    FlowcoreConnectorConfig,
+    FlowcoreRobotConfig,
+    ensure_unique_fleet_robot_ids,
+)
+
+# Placeholder map returned by fetch_robot_map(), built without validation since it is constant
+_EMPTY_MAP_KWARGS = MappingProxyType(
+    {"image": b"", "map_label": "", "origin_x": 0.0, "origin_y": 0.0, "resolution": 0.0}
+)
+
+
+@functools.cache
+def _static_key_values() -> Mapping[str, str]:
+    """Get the key-values that don't change during the connector lifetime.
+
+    Built on first use, so importing this module doesn't look up the package version.
+
+    Returns:
+        Mapping[str, str]: Read-only key-values published every loop
+    """
+    # Local
+    from flowcore_connector import __version__ as connector_version
+
+    return MappingProxyType({"connector_version": connector_version})
 
 
 class FlowcoreConnector(FleetConnector):
@@ -40,6 +67,38 @@ class FlowcoreConnector(FleetConnector):
 
         self._logger.info("Initialized FLOWCore Connector")
 
+    @override
+    def update_fleet(self, fleet: list[RobotConfig]) -> None:
+        """Update the robot fleet and the per-robot lookup tables.
+
+        The lookup tables are not used yet. They are meant for mapping FLOWCore API data to
+        InOrbit robots once polling is implemented.
+
+        Args:
+            fleet: The new fleet configuration. Entries must be FlowcoreRobotConfig instances,
+                e.g. built from robots fetched from the FLOWCore API in _connect()
+
+        Raises:
+            TypeError: If an entry is not a FlowcoreRobotConfig
+            ValueError: If fleet_robot_id values are not unique
+        """
+        for robot in fleet:
+            if not isinstance(robot, FlowcoreRobotConfig):
+                raise TypeError(
+                    f"Robot {robot.robot_id} configuration must be a FlowcoreRobotConfig, "
+                    f"got {type(robot).__name__}"
+                )
+        ensure_unique_fleet_robot_ids(fleet)
+        super().update_fleet(fleet)
+        self._interned_ids = [sys.intern(robot_id) for robot_id in self.robot_ids]
+        # Robot configurations indexed by InOrbit and FLOWCore robot IDs, for O(1) lookups
+        self._by_robot_id: dict[str, FlowcoreRobotConfig] = {
+            robot.robot_id: robot for robot in self.config.fleet
+        }
+        self._by_fleet_id: dict[int, FlowcoreRobotConfig] = {
+            robot.fleet_robot_id: robot for robot in self.config.fleet
+        }
+
     @override
     async def _connect(self) -> None:
         """Connect to FLOWCore API and start polling."""
@@ -53,10 +112,13 @@ class FlowcoreConnector(FleetConnector):
     @override
     async def _execution_loop(self) -> None:
         """Main execution loop - publish cached robot data to InOrbit."""
-        for robot_id in self.robot_ids:
-            self.publish_robot_key_values(robot_id, {
-                "connector_version": connector_version,
-            })
+        # Publishing only serializes the message and queues it on the MQTT client, which sends
+        # it from its own network thread, so there is nothing to gain from publishing robots
+        # concurrently. Offloading each call to a thread would only add overhead.
+        static_key_values = _static_key_values()
+        for robot_id in self._interned_ids:
+            # Publish through the session to pass the static key-values without copying them
+            self._get_robot_session(robot_id).publish_key_values(static_key_values)
         self._logger.debug("Executing main execution loop")
 
     @override
@@ -85,9 +147,7 @@ class FlowcoreConnector(FleetConnector):
         options["result_function"](CommandResultCode.SUCCESS)
 
     @override
-    async def fetch_robot_map(
-        self, robot_id: str, frame_id: str
-    ) -> MapConfigTemp | None:
+    async def fetch_robot_map(self, robot_id: str, frame_id: str) -> MapConfigTemp | None:
         """Fetch a map from the FLOWCore API.
 
         This method is called automatically by the base class when a pose is published
@@ -105,17 +165,8 @@ class FlowcoreConnector(FleetConnector):
         try:
             # Fetch the map
 
-            return MapConfigTemp(
-                image=bytes(),
-                map_id=frame_id,
-                map_label="",
-                origin_x=0.0,
-                origin_y=0.0,
-                resolution=0.0,
-            )
+            return MapConfigTemp.model_construct(map_id=frame_id, **_EMPTY_MAP_KWARGS)
 
         except Exception as ex:
-            self._logger.error(
-                f"Failed to fetch map '{frame_id}' from FLOWCore API: {ex}"
-            )
+            self._logger.error(f"Failed to fetch map '{frame_id}' from FLOWCore API: {ex}")
             return None
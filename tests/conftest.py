@@ -9,20 +9,26 @@ Test-wide fixtures.
 from __future__ import annotations
 
 import asyncio
+import types
 
 import pytest
 
 
+@types.coroutine
+def _yield_once():
+    """Suspend the awaiting task for a single event loop iteration."""
+    yield
+
+
 @pytest.fixture(autouse=True)
 def _fast_asyncio_sleep(monkeypatch):
-    """Short-circuit asyncio.sleep to keep tests fast while still yielding the loop.
-    """
-
-    original_sleep = asyncio.sleep
+    """Short-circuit asyncio.sleep to keep tests fast while still yielding the loop."""
 
     async def _sleep_stub(delay, *args, **kwargs):  # type: ignore[unused-argument]
         # Yield control once so background tasks can run, but don't actually delay.
-        await original_sleep(0)
+        # A bare yield is what asyncio.sleep(0) does internally, without the call overhead.
+        # Awaiting an already resolved future would not suspend the task at all.
+        await _yield_once()
 
     monkeypatch.setattr(asyncio, "sleep", _sleep_stub)
     yield
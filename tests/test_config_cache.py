@@ -0,0 +1,151 @@
+# SPDX-FileCopyrightText: 2026 InOrbit, Inc.
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for `flowcore_connector.src.config.cache`."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from flowcore_connector.src.config import cache
+from flowcore_connector.src.config.cache import (
+    _default_cache_dir,
+    config_cache_key,
+    load_cached_config,
+    store_cached_config,
+)
+from flowcore_connector.src.config.models import FlowcoreConnectorConfig
+
+CONFIG_DATA = {
+    "connector_type": "flowcore",
+    "connector_config": {
+        "fleet_host": "fleet.example.com",
+        "fleet_username": "dummy-user",
+        "fleet_password": "dummy-pass",
+    },
+    "fleet": [{"robot_id": "robot-alpha", "fleet_robot_id": 101}],
+}
+
+
+@pytest.fixture()
+def config() -> FlowcoreConnectorConfig:
+    """Return a minimal, valid FlowcoreConnectorConfig."""
+
+    return FlowcoreConnectorConfig(**CONFIG_DATA)
+
+
+@pytest.fixture()
+def config_file(tmp_path: Path) -> Path:
+    config_file = tmp_path / "fleet.yaml"
+    config_file.write_text("connector_type: flowcore\n")
+    return config_file
+
+
+def test_store_and_load_cached_config(tmp_path: Path, config: FlowcoreConnectorConfig) -> None:
+    cache_dir = tmp_path / "cache"
+
+    assert load_cached_config("key", cache_dir) is None
+    store_cached_config("key", config, cache_dir)
+
+    assert load_cached_config("key", cache_dir) == config
+    assert (cache_dir / "key.pkl").stat().st_mode & 0o077 == 0
+
+
+def test_unreadable_cache_entry_is_ignored(tmp_path: Path) -> None:
+    (tmp_path / "key.pkl").write_bytes(b"not a pickle")
+
+    assert load_cached_config("key", tmp_path) is None
+
+
+def test_cache_key_changes_with_file_contents(config_file: Path) -> None:
+    key = config_cache_key(str(config_file))
+    assert config_cache_key(str(config_file)) == key
+
+    config_file.write_text("connector_type: other\n")
+    os.utime(config_file, ns=(0, 0))
+
+    assert config_cache_key(str(config_file)) != key
+
+
+def test_cache_key_changes_with_environment(
+    config_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    key = config_cache_key(str(config_file))
+
+    monkeypatch.setenv("INORBIT_FLOWCORE_FLEET_PASSWORD", "env-pass")
+
+    assert config_cache_key(str(config_file)) != key
+
+
+def test_cache_key_changes_with_extra_values(config_file: Path) -> None:
+    assert config_cache_key(str(config_file), "a") != config_cache_key(str(config_file), "b")
+
+
+def test_cache_key_changes_with_working_directory(
+    tmp_path: Path, config_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    key = config_cache_key(str(config_file))
+
+    monkeypatch.chdir(tmp_path)
+
+    assert config_cache_key(str(config_file)) != key
+
+
+@pytest.mark.parametrize("name", ["version", "schema"])
+def test_cache_key_changes_with_code(
+    config_file: Path, monkeypatch: pytest.MonkeyPatch, name: str
+) -> None:
+    key = config_cache_key(str(config_file))
+
+    if name == "version":
+        monkeypatch.setattr(cache.metadata, "version", lambda distribution: "0.0.0")
+    else:
+        monkeypatch.setattr(
+            FlowcoreConnectorConfig, "model_json_schema", classmethod(lambda cls: {"new": "field"})
+        )
+    cache._code_fingerprint.cache_clear()
+    try:
+        assert config_cache_key(str(config_file)) != key
+    finally:
+        cache._code_fingerprint.cache_clear()
+
+
+def test_cached_config_with_missing_map_file_is_ignored(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    map_file = tmp_path / "map.png"
+    map_file.write_bytes(b"")
+    config = FlowcoreConnectorConfig(
+        **CONFIG_DATA,
+        maps={
+            "frame": {
+                "file": "map.png",
+                "map_id": "map",
+                "origin_x": 0.0,
+                "origin_y": 0.0,
+                "resolution": 0.05,
+            }
+        },
+    )
+    store_cached_config("key", config, tmp_path)
+    assert load_cached_config("key", tmp_path) == config
+
+    map_file.unlink()
+
+    assert load_cached_config("key", tmp_path) is None
+
+
+def test_default_cache_dir_ignores_empty_xdg_cache_home(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CACHE_HOME", "")
+    assert _default_cache_dir() == tmp_path / ".cache" / "flowcore-connector"
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert _default_cache_dir() == tmp_path / "xdg" / "flowcore-connector"
@@ -7,17 +7,21 @@
 from __future__ import annotations
 
 import copy
+import os
+from pathlib import Path
 
 import pytest
+from pydantic_settings import DotEnvSettingsSource
 
+from flowcore_connector.src.config import models
 from flowcore_connector.src.config.models import (
+    CONNECTOR_TYPE,
     FlowcoreConfig,
     FlowcoreConnectorConfig,
     FlowcoreRobotConfig,
-    CONNECTOR_TYPE,
+    ensure_unique_fleet_robot_ids,
 )
 
-
 REQUIRED_FLEET_CONFIG = {
     "fleet_host": "fleet.example.com",
     "fleet_port": 8080,
@@ -54,7 +58,7 @@ def test_invalid_connector_type_raises(base_config_data: dict) -> None:
     data = copy.deepcopy(base_config_data)
     data["connector_type"] = f"not-{CONNECTOR_TYPE}"
 
-    with pytest.raises(ValueError, match=f"Expected connector type '{CONNECTOR_TYPE}'"):
+    with pytest.raises(ValueError, match=f"connector_type\n  Input should be '{CONNECTOR_TYPE}'"):
         FlowcoreConnectorConfig(**data)
 
 
@@ -66,6 +70,18 @@ def test_unique_fleet_robot_ids_are_required(base_config_data: dict) -> None:
         FlowcoreConnectorConfig(**data)
 
 
+def test_ensure_unique_fleet_robot_ids() -> None:
+    fleet = [
+        FlowcoreRobotConfig(robot_id="robot-alpha", fleet_robot_id=101),
+        FlowcoreRobotConfig(robot_id="robot-beta", fleet_robot_id=101),
+    ]
+
+    with pytest.raises(ValueError, match="101 is duplicated"):
+        ensure_unique_fleet_robot_ids(fleet)
+
+    ensure_unique_fleet_robot_ids(fleet[:1])
+
+
 def test_valid_config_instantiates_models(base_config_data: dict) -> None:
     config = FlowcoreConnectorConfig(**base_config_data)
 
@@ -73,6 +89,15 @@ def test_valid_config_instantiates_models(base_config_data: dict) -> None:
     assert all(isinstance(robot, FlowcoreRobotConfig) for robot in config.fleet)
 
 
+def test_nested_models_are_frozen(base_config_data: dict) -> None:
+    config = FlowcoreConnectorConfig(**base_config_data)
+
+    with pytest.raises(ValueError, match="frozen"):
+        config.fleet[0].fleet_robot_id = 103
+    with pytest.raises(ValueError, match="frozen"):
+        config.connector_config.fleet_port = 8443
+
+
 def test_flowcore_config_reads_from_environment_variables(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -147,3 +172,70 @@ def test_flowcore_config_default_port() -> None:
     )
 
     assert config.fleet_port == 80
+
+
+def test_flowcore_config_ignores_unknown_fields() -> None:
+    config = FlowcoreConfig(**REQUIRED_FLEET_CONFIG, unknown_field="value")
+
+    assert not hasattr(config, "unknown_field")
+    assert config.model_extra is None
+
+
+def test_flowcore_config_env_file_is_parsed_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the env file is only parsed again after it is modified."""
+    monkeypatch.chdir(tmp_path)
+    env_file = tmp_path / models.DEFAULT_ENV_FILE
+    env_file.parent.mkdir()
+    env_file.write_text("INORBIT_FLOWCORE_FLEET_HOST=dotenv-fleet.example.com\n")
+    models._read_env_file.cache_clear()
+
+    reads = []
+    static_read_env_file = DotEnvSettingsSource._static_read_env_file
+
+    def _counting_read(*args, **kwargs):
+        reads.append(args[0])
+        return static_read_env_file(*args, **kwargs)
+
+    monkeypatch.setattr(DotEnvSettingsSource, "_static_read_env_file", _counting_read)
+    config_data = {key: val for key, val in REQUIRED_FLEET_CONFIG.items() if key != "fleet_host"}
+
+    assert FlowcoreConfig(**config_data).fleet_host == "dotenv-fleet.example.com"
+    assert FlowcoreConfig(**config_data).fleet_host == "dotenv-fleet.example.com"
+    assert len(reads) == 1
+
+    env_file.write_text("INORBIT_FLOWCORE_FLEET_HOST=updated-fleet.example.com\n")
+    os.utime(env_file, ns=(0, 0))
+
+    assert FlowcoreConfig(**config_data).fleet_host == "updated-fleet.example.com"
+    assert len(reads) == 2
+
+
+def test_flowcore_config_env_file_override(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the per-instance _env_file override is honored."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "other.env").write_text("INORBIT_FLOWCORE_FLEET_HOST=other\n")
+
+    config = FlowcoreConfig(_env_file="other.env", fleet_username="u", fleet_password="p")
+
+    assert config.fleet_host == "other"
+
+
+def test_flowcore_config_env_file_settings_overrides(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that per-instance env settings overrides apply to the env file."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "my.env").write_text("X_FLEET_HOST=my-fleet\nX_FLEET_PORT=\n")
+
+    config = FlowcoreConfig(
+        _env_file="my.env",
+        _env_prefix="X_",
+        _env_ignore_empty=True,
+        fleet_username="u",
+        fleet_password="p",
+    )
+
+    assert config.fleet_host == "my-fleet"
+    assert config.fleet_port == 80
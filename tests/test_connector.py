@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: 2026 InOrbit, Inc.
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for `flowcore_connector.src.connector`."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from inorbit_connector.models import MapConfigTemp, RobotConfig
+
+from flowcore_connector import __version__
+from flowcore_connector.src import connector as connector_module
+from flowcore_connector.src.config.models import FlowcoreConnectorConfig, FlowcoreRobotConfig
+from flowcore_connector.src.connector import FlowcoreConnector
+
+# FleetConnector.__init__() dumps inorbit_edge's RobotSessionModel, whose URL defaults are plain
+# strings, which makes Pydantic warn on serialization
+pytestmark = pytest.mark.filterwarnings("ignore:Pydantic serializer warnings:UserWarning")
+
+
+@pytest.fixture()
+def connector(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> FlowcoreConnector:
+    """Return a connector for a fleet of two robots, without starting it."""
+    # The connector log file is written to the working directory
+    monkeypatch.chdir(tmp_path)
+    config = FlowcoreConnectorConfig(
+        api_key="test-api-key",
+        connector_type="flowcore",
+        connector_config={
+            "fleet_host": "fleet.example.com",
+            "fleet_username": "dummy-user",
+            "fleet_password": "dummy-pass",
+        },
+        fleet=[
+            {"robot_id": "robot-alpha", "fleet_robot_id": 101},
+            {"robot_id": "robot-beta", "fleet_robot_id": 102},
+        ],
+    )
+    return FlowcoreConnector(config)
+
+
+@pytest.mark.asyncio
+async def test_execution_loop_publishes_static_key_values(connector: FlowcoreConnector) -> None:
+    sessions = {robot_id: mock.Mock() for robot_id in connector.robot_ids}
+
+    with mock.patch.object(connector, "_get_robot_session", side_effect=sessions.get):
+        await connector._execution_loop()
+
+    for session in sessions.values():
+        session.publish_key_values.assert_called_once_with(connector_module._static_key_values())
+
+
+def test_static_key_values_are_read_only() -> None:
+    static_key_values = connector_module._static_key_values()
+
+    assert static_key_values == {"connector_version": __version__}
+    assert connector_module._static_key_values() is static_key_values
+    with pytest.raises(TypeError):
+        static_key_values["connector_version"] = "modified"  # type: ignore[index]
+
+
+@pytest.mark.asyncio
+async def test_fetch_robot_map_returns_placeholder_map(connector: FlowcoreConnector) -> None:
+    map_config = await connector.fetch_robot_map("robot-alpha", "frame-1")
+
+    assert map_config == MapConfigTemp(
+        image=b"",
+        map_id="frame-1",
+        map_label="",
+        origin_x=0.0,
+        origin_y=0.0,
+        resolution=0.0,
+    )
+
+
+def test_update_fleet_rebuilds_lookup_tables(connector: FlowcoreConnector) -> None:
+    alpha = connector._by_robot_id["robot-alpha"]
+    assert connector._by_fleet_id == {101: alpha, 102: connector._by_robot_id["robot-beta"]}
+    assert connector._interned_ids == ["robot-alpha", "robot-beta"]
+
+    gamma = FlowcoreRobotConfig(robot_id="robot-gamma", fleet_robot_id=103)
+    connector.update_fleet([alpha, gamma])
+
+    assert connector._interned_ids == ["robot-alpha", "robot-gamma"]
+    assert connector._by_robot_id == {"robot-alpha": alpha, "robot-gamma": gamma}
+    assert connector._by_fleet_id == {101: alpha, 103: gamma}
+
+
+def test_update_fleet_rejects_duplicate_fleet_robot_ids(connector: FlowcoreConnector) -> None:
+    fleet = list(connector.config.fleet)
+    duplicate = FlowcoreRobotConfig(robot_id="robot-gamma", fleet_robot_id=101)
+
+    with pytest.raises(ValueError, match="fleet_robot_id values must be unique"):
+        connector.update_fleet([*fleet, duplicate])
+
+    assert connector.config.fleet == fleet
+
+
+def test_update_fleet_rejects_plain_robot_configs(connector: FlowcoreConnector) -> None:
+    with pytest.raises(TypeError, match="must be a FlowcoreRobotConfig"):
+        connector.update_fleet([RobotConfig(robot_id="robot-gamma")])
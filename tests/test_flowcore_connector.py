@@ -0,0 +1,227 @@
+# SPDX-FileCopyrightText: 2026 InOrbit, Inc.
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for `flowcore_connector.flowcore_connector`."""
+
+from __future__ import annotations
+
+import copy
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from flowcore_connector import flowcore_connector
+from flowcore_connector.flowcore_connector import (
+    HELP,
+    CommandLineArgs,
+    _build_trusted,
+    _fast_read_yaml,
+    _load_config,
+    _parse_args,
+)
+from flowcore_connector.src.config import cache
+from flowcore_connector.src.config.models import (
+    FlowcoreConfig,
+    FlowcoreConnectorConfig,
+    FlowcoreRobotConfig,
+)
+
+
+@pytest.fixture()
+def yaml_data() -> dict:
+    """Return a minimal, valid configuration as read from a YAML file."""
+
+    return {
+        "connector_type": "flowcore",
+        "logging": {"log_level": "INFO"},
+        "connector_config": {
+            "fleet_host": "fleet.example.com",
+            "fleet_username": "dummy-user",
+            "fleet_password": "dummy-pass",
+        },
+        "fleet": [
+            {"robot_id": "robot-alpha", "fleet_robot_id": 101},
+            {"robot_id": "robot-beta", "fleet_robot_id": 102, "cameras": []},
+        ],
+    }
+
+
+def test_build_trusted_matches_validated_config(yaml_data: dict) -> None:
+    trusted = _build_trusted(yaml_data)
+    validated = FlowcoreConnectorConfig(**yaml_data)
+
+    assert isinstance(trusted.connector_config, FlowcoreConfig)
+    assert all(isinstance(robot, FlowcoreRobotConfig) for robot in trusted.fleet)
+    assert trusted.connector_config == validated.connector_config
+    assert trusted.fleet == validated.fleet
+
+
+def test_build_trusted_checks_unique_fleet_robot_ids(yaml_data: dict) -> None:
+    data = copy.deepcopy(yaml_data)
+    data["fleet"][1]["fleet_robot_id"] = data["fleet"][0]["fleet_robot_id"]
+
+    with pytest.raises(ValueError, match="fleet_robot_id values must be unique"):
+        _build_trusted(data)
+
+
+def test_build_trusted_validates_connector_type(yaml_data: dict) -> None:
+    data = copy.deepcopy(yaml_data)
+    data["connector_type"] = "not-flowcore"
+
+    with pytest.raises(ValueError, match="Input should be 'flowcore'"):
+        _build_trusted(data)
+
+
+@pytest.mark.parametrize("yaml_data", [5, [1], None])
+def test_build_trusted_rejects_non_mapping_configuration(yaml_data: object) -> None:
+    with pytest.raises(ValueError, match="configuration must be a mapping"):
+        _build_trusted(yaml_data)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "robot, message",
+    [
+        ({"fleet_robot_id": 103}, r"fleet\[2\].robot_id must be a string"),
+        ({"robot_id": "robot-gamma"}, r"fleet\[2\].fleet_robot_id must be an integer"),
+        (
+            {"robot_id": "robot-gamma", "fleet_robot_id": "101"},
+            r"fleet\[2\].fleet_robot_id must be an integer",
+        ),
+        (
+            {"robot_id": "robot-gamma", "fleet_robot_id": 103, "cameras": ["camera"]},
+            r"fleet\[2\].cameras must be a list of mappings",
+        ),
+        ("robot-gamma", r"fleet\[2\] must be a mapping"),
+    ],
+)
+def test_build_trusted_rejects_malformed_robots(
+    yaml_data: dict, robot: object, message: str
+) -> None:
+    data = copy.deepcopy(yaml_data)
+    data["fleet"].append(robot)
+
+    with pytest.raises(ValueError, match=message):
+        _build_trusted(data)
+
+
+def test_fast_read_yaml(tmp_path) -> None:
+    config_file = tmp_path / "fleet.yaml"
+    config_file.write_text("connector_type: flowcore\nfleet:\n  - robot_id: robot-alpha\n")
+
+    assert _fast_read_yaml(str(config_file)) == {
+        "connector_type": "flowcore",
+        "fleet": [{"robot_id": "robot-alpha"}],
+    }
+
+
+def test_fast_read_yaml_empty_file(tmp_path) -> None:
+    config_file = tmp_path / "fleet.yaml"
+    config_file.write_text("")
+
+    assert _fast_read_yaml(str(config_file)) == {}
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["-c", "fleet.yaml"], CommandLineArgs("fleet.yaml")),
+        (["-cfleet.yaml"], CommandLineArgs("fleet.yaml")),
+        (["--config=fleet.yaml"], CommandLineArgs("fleet.yaml")),
+        (
+            ["--trust-config", "--config", "fleet.yaml", "--cache-config"],
+            CommandLineArgs("fleet.yaml", trust_config=True, cache_config=True),
+        ),
+    ],
+)
+def test_parse_args(argv: list[str], expected: CommandLineArgs) -> None:
+    assert _parse_args(argv) == expected
+
+
+@pytest.mark.parametrize("argv", [[], ["-c"], ["-c", "--trust-config"], ["-c", "x", "--bogus"]])
+def test_parse_args_errors_exit_with_help(argv: list[str], capsys) -> None:
+    with pytest.raises(SystemExit) as exc_info:
+        _parse_args(argv)
+
+    assert exc_info.value.code == 2
+    assert capsys.readouterr().out == HELP
+
+
+def test_parse_args_version(capsys) -> None:
+    with pytest.raises(SystemExit) as exc_info:
+        _parse_args(["--version"])
+
+    assert exc_info.value.code == 0
+    assert capsys.readouterr().out.startswith("flowcore-connector ")
+
+
+@pytest.fixture()
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the configuration cache to a temporary directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(cache, "DEFAULT_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+def test_load_config_uses_cache(
+    tmp_path: Path, yaml_data: dict, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_file = tmp_path / "fleet.yaml"
+    config_file.write_text(yaml.safe_dump(yaml_data))
+
+    # Miss: the configuration is built from the file and stored
+    config = _load_config(str(config_file), use_cache=True)
+    assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+    # Hit: the file is not parsed again
+    def _fail_read_yaml(path: str) -> dict:
+        raise AssertionError("configuration file parsed on a cache hit")
+
+    with monkeypatch.context() as m:
+        m.setattr(flowcore_connector, "_fast_read_yaml", _fail_read_yaml)
+        assert _load_config(str(config_file), use_cache=True) == config
+
+    # Miss after the file changes
+    yaml_data["fleet"][0]["robot_id"] = "robot-gamma"
+    config_file.write_text(yaml.safe_dump(yaml_data))
+    os.utime(config_file, ns=(0, 0))
+
+    assert _load_config(str(config_file), use_cache=True).fleet[0].robot_id == "robot-gamma"
+    assert len(list(cache_dir.glob("*.pkl"))) == 2
+
+
+def test_load_config_cache_does_not_hide_missing_map_file(
+    tmp_path: Path, yaml_data: dict, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config_file = tmp_path / "fleet.yaml"
+    yaml_data["maps"] = {
+        "frame": {
+            "file": "maps/map.png",
+            "map_id": "map",
+            "origin_x": 0.0,
+            "origin_y": 0.0,
+            "resolution": 0.05,
+        }
+    }
+    config_file.write_text(yaml.safe_dump(yaml_data))
+    with_map_dir = tmp_path / "with-map"
+    (with_map_dir / "maps").mkdir(parents=True)
+    (with_map_dir / "maps" / "map.png").write_bytes(b"")
+    without_map_dir = tmp_path / "without-map"
+    without_map_dir.mkdir()
+
+    monkeypatch.chdir(with_map_dir)
+    _load_config(str(config_file), use_cache=True)
+
+    # A different working directory doesn't reuse the entry
+    monkeypatch.chdir(without_map_dir)
+    with pytest.raises(ValueError, match="Path does not point to a file"):
+        _load_config(str(config_file), use_cache=True)
+
+    # A cache hit doesn't hide a map file removed since the entry was stored
+    monkeypatch.chdir(with_map_dir)
+    (with_map_dir / "maps" / "map.png").unlink()
+    with pytest.raises(ValueError, match="Path does not point to a file"):
+        _load_config(str(config_file), use_cache=True)